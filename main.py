@@ -200,8 +200,7 @@ def single_collection(args):
         
         # Read statistics
         print("Reading statistics and accounting data...")
-        statistics_data = reader.read_statistics_queue()
-        accounting_data = reader.read_accounting_queue()
+        statistics_data, accounting_data = reader.drain_queues()
         
         if not statistics_data and not accounting_data:
             print("No statistics or accounting data found")
@@ -26,7 +26,9 @@ STATS_CONFIG = {
     "collect_channel_stats": True,
     "collect_qmgr_stats": True,
     "output_format": "json",
-    "include_timestamps": True
+    "include_timestamps": True,
+    "parallel_drain": False,  # Drain both queues on two threads (MQGETs still serialize on the shared connection)
+    "include_legacy_connection_info": False  # Emit connection_info_legacy in accounting records
 }
 
 # Time series database configuration (for future use)
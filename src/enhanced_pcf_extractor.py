@@ -21,6 +21,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Parameter header as read by the structured fallback parser
+_PARAM_HEADER_STRUCT = struct.Struct('>II')
+
 class EnhancedPCFExtractor:
     """Enhanced PCF data extractor for application tags and client IPs"""
     
@@ -127,7 +130,7 @@ class EnhancedPCFExtractor:
             while offset < len(data) - 8:
                 try:
                     # Read parameter header
-                    param_type, param_length = struct.unpack('>II', data[offset:offset+8])
+                    param_type, param_length = _PARAM_HEADER_STRUCT.unpack_from(data, offset)
                     
                     if param_length < 8 or param_length > len(data) - offset:
                         break
@@ -161,7 +164,7 @@ class EnhancedPCFExtractor:
             return info
             
         except Exception as e:
-            logger.debug(f"Structured PCF parsing failed: {e}")
+            logger.debug("Structured PCF parsing failed: %s", e)
             return info
     
     def _extract_by_patterns(self, data: bytes) -> Dict[str, Any]:
@@ -182,7 +185,7 @@ class EnhancedPCFExtractor:
                 if app_name:
                     info['application_name'] = app_name.strip()
                     info['raw_data_found'] = True
-                    logger.debug(f"Found application name via pattern: {app_name}")
+                    logger.debug("Found application name via pattern: %s", app_name)
                     break
         
         # Search for IP addresses and connection names
@@ -193,14 +196,14 @@ class EnhancedPCFExtractor:
             info['client_ip'] = ip
             info['connection_name'] = f"{ip}({port})"
             info['raw_data_found'] = True
-            logger.debug(f"Found connection via pattern: {ip}({port})")
+            logger.debug("Found connection via pattern: %s(%s)", ip, port)
         else:
             # Just look for IP addresses
             ip_match = self.ip_pattern.search(data)
             if ip_match:
                 info['client_ip'] = ip_match.group(1).decode()
                 info['raw_data_found'] = True
-                logger.debug(f"Found IP via pattern: {info['client_ip']}")
+                logger.debug("Found IP via pattern: %s", info['client_ip'])
         
         return info
     
@@ -234,7 +237,7 @@ class EnhancedPCFExtractor:
                 if match:
                     info['application_name'] = match.group(1)
                     info['raw_data_found'] = True
-                    logger.debug(f"Found application via brute force: {match.group(1)}")
+                    logger.debug("Found application via brute force: %s", match.group(1))
                     break
             
             # Look for IP addresses in text
@@ -242,12 +245,12 @@ class EnhancedPCFExtractor:
             if ip_match:
                 info['client_ip'] = ip_match.group(1)
                 info['raw_data_found'] = True
-                logger.debug(f"Found IP via brute force: {ip_match.group(1)}")
+                logger.debug("Found IP via brute force: %s", ip_match.group(1))
             
             return info
             
         except Exception as e:
-            logger.debug(f"Brute force extraction failed: {e}")
+            logger.debug("Brute force extraction failed: %s", e)
             return info
     
     def _extract_string_parameter(self, param_data: bytes) -> Optional[str]:
@@ -4,6 +4,8 @@ IBM MQ Constants for PCF (Programmable Command Format) Message Parsing
 These constants are used for parsing PCF messages from IBM MQ statistics and accounting queues.
 """
 
+from functools import lru_cache
+
 # PCF Command Format Types (MQCFT_*) - IBM MQ 9.4.x Documentation
 MQCFT_NONE = 0
 MQCFT_COMMAND = 1
@@ -248,9 +250,14 @@ MESSAGE_TYPES = {
     22: 'accounting',
 }
 
+@lru_cache(maxsize=4096)
 def get_parameter_name(param_id: int) -> str:
     """Get human-readable parameter name from parameter ID"""
-    return PARAMETER_NAMES.get(param_id, f'UNKNOWN_PARAM_{param_id}_0x{param_id:08X}')
+    name = PARAMETER_NAMES.get(param_id)
+    if name is None:
+        # Only format the placeholder on a miss, not on every lookup
+        name = f'UNKNOWN_PARAM_{param_id}_0x{param_id:08X}'
+    return name
 
 def get_message_type(structure_type: int) -> str:
     """Determine the type of PCF message based on structure type"""
@@ -11,20 +11,43 @@ Date: November 2025
 
 import json
 import logging
+from logging.handlers import RotatingFileHandler
 import sys
 import base64
+import struct
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import pymqi
 try:
     from .config import MQ_CONFIG, QUEUE_CONFIG, STATS_CONFIG
     from .pcf_parser import PCFParser
+    from . import mq_constants as mqc
 except ImportError:
     # For direct execution or when not imported as a package
     import os
     sys.path.insert(0, os.path.dirname(__file__))
     from config import MQ_CONFIG, QUEUE_CONFIG, STATS_CONFIG
     from pcf_parser import PCFParser
+    import mq_constants as mqc
+
+try:
+    from enhanced_pcf_extractor import EnhancedPCFExtractor
+except ImportError:
+    EnhancedPCFExtractor = None
+
+
+# Leading MQCFH fields (type, length, version, command) in either byte order
+_PCF_PREFIX_BE = struct.Struct('>4L')
+_PCF_PREFIX_LE = struct.Struct('<4L')
+
+# PCF command code to statistics type for the fallback identification path
+_STATISTICS_COMMAND_TYPES = {
+    mqc.MQCMD_STATISTICS_Q: "queue_statistics",
+    mqc.MQCMD_STATISTICS_CHANNEL: "channel_statistics",
+    mqc.MQCMD_STATISTICS_MQI: "qmgr_statistics",
+}
 
 
 class MQJSONEncoder(json.JSONEncoder):
@@ -49,41 +72,56 @@ class MQStatsReader:
         self.qmgr = None
         self.logger = self._setup_logging()
         self.pcf_parser = PCFParser()
+        self._enhanced_extractor = EnhancedPCFExtractor() if EnhancedPCFExtractor is not None else None
+        
+        # Connection parameters never change for a reader, so encode them once
+        self._qmgr_name = MQ_CONFIG['queue_manager'].encode('utf-8')
+        self._channel_name = MQ_CONFIG['channel'].encode('utf-8')
+        self._connection_name = MQ_CONFIG['connection_name'].encode('utf-8')
+        self._user = (MQ_CONFIG.get('user') or '').encode('utf-8')
+        self._password = (MQ_CONFIG.get('password') or '').encode('utf-8')
         
     def _setup_logging(self) -> logging.Logger:
-        """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('mq_stats_reader.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        """Setup logging configuration once per process"""
+        # basicConfig ignores handlers once the root logger is configured, but the
+        # handler list is built (and the log file opened) before that check
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[
+                    RotatingFileHandler('mq_stats_reader.log', maxBytes=10_000_000, backupCount=5),
+                    logging.StreamHandler(sys.stdout)
+                ]
+            )
         return logging.getLogger(__name__)
     
     def connect_to_mq(self) -> bool:
         """Establish connection to IBM MQ Queue Manager"""
         try:
-            # Connection parameters
-            conn_info = f"{MQ_CONFIG['connection_name']}"
-            
             # Create connection details
             cd = pymqi.CD()
-            cd.ChannelName = MQ_CONFIG['channel'].encode('utf-8')
-            cd.ConnectionName = conn_info.encode('utf-8')
+            cd.ChannelName = self._channel_name
+            cd.ConnectionName = self._connection_name
             cd.ChannelType = pymqi.CMQC.MQCHT_CLNTCONN
             cd.TransportType = pymqi.CMQC.MQXPT_TCP
             
             # Optional: Set user credentials if required
-            if MQ_CONFIG.get('user'):
-                cd.UserIdentifier = MQ_CONFIG['user'].encode('utf-8')
-                if MQ_CONFIG.get('password'):
-                    cd.Password = MQ_CONFIG['password'].encode('utf-8')
+            if self._user:
+                cd.UserIdentifier = self._user
+                if self._password:
+                    cd.Password = self._password
             
             # Connect to queue manager
             self.qmgr = pymqi.QueueManager(None)
-            self.qmgr.connect_with_options(MQ_CONFIG['queue_manager'].encode('utf-8'), cd)
+            if STATS_CONFIG.get("parallel_drain", False):
+                # HANDLE_SHARE_BLOCK lets the statistics and accounting drains use the
+                # same connection from separate threads (MQ blocks each call until the
+                # other thread's call on the handle completes)
+                self.qmgr.connect_with_options(self._qmgr_name, cd=cd,
+                                               opts=pymqi.CMQC.MQCNO_HANDLE_SHARE_BLOCK)
+            else:
+                self.qmgr.connect_with_options(self._qmgr_name, cd)
             
             self.logger.info("Successfully connected to Queue Manager: %s", MQ_CONFIG['queue_manager'])
             return True
@@ -103,103 +141,76 @@ class MQStatsReader:
     
     def read_statistics_queue(self) -> List[Dict[str, Any]]:
         """Read messages from the statistics queue"""
-        statistics_data = []
-        
-        try:
-            # Open statistics queue for reading
-            queue = pymqi.Queue(self.qmgr, QUEUE_CONFIG['statistics_queue'])
-            
-            # Message descriptor
-            md = pymqi.MD()
-            
-            # Get message options
-            gmo = pymqi.GMO()
-            gmo.Options = pymqi.CMQC.MQGMO_NO_WAIT | pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING
-            
-            message_count = 0
-            while True:
-                try:
-                    # Reset message descriptor for each message
-                    md = pymqi.MD()
-                    
-                    # Get message
-                    message = queue.get(None, md, gmo)
-                    message_count += 1
-                    
-                    # Parse the message
-                    parsed_data = self._parse_statistics_message(message, md)
-                    if parsed_data:
-                        statistics_data.append(parsed_data)
-                        
-                except pymqi.MQMIError as e:
-                    if e.reason == pymqi.CMQC.MQRC_NO_MSG_AVAILABLE:
-                        break  # No more messages
-                    else:
-                        self.logger.error("Error reading statistics message: %s", e)
-                        break
-            
-            queue.close()
-            self.logger.info("Read %d statistics messages", message_count)
-            
-        except pymqi.MQMIError as e:
-            self.logger.error("Failed to read statistics queue: %s", e)
-        except (ValueError, TypeError) as e:
-            self.logger.error("Data parsing error reading statistics: %s", e)
-        
-        return statistics_data
+        return self._drain_queue(QUEUE_CONFIG['statistics_queue'], self._parse_statistics_message, "statistics")
     
     def read_accounting_queue(self) -> List[Dict[str, Any]]:
         """Read messages from the accounting queue"""
-        accounting_data = []
+        return self._drain_queue(QUEUE_CONFIG['accounting_queue'], self._parse_accounting_message, "accounting")
+    
+    def _drain_queue(self, queue_name: str,
+                     parse_message: Callable[[bytes, pymqi.MD, Optional[str]], Optional[Dict[str, Any]]],
+                     kind: str) -> List[Dict[str, Any]]:
+        """Drain a queue without waiting and return each successfully parsed message"""
+        messages = []
         
         try:
-            # Open accounting queue for reading
-            queue = pymqi.Queue(self.qmgr, QUEUE_CONFIG['accounting_queue'])
-            
-            # Message descriptor
-            md = pymqi.MD()
+            # Open queue for reading
+            queue = pymqi.Queue(self.qmgr, queue_name)
             
             # Get message options
             gmo = pymqi.GMO()
             gmo.Options = pymqi.CMQC.MQGMO_NO_WAIT | pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING
             
+            # One collection timestamp for the whole drain
+            timestamp = datetime.now(timezone.utc).isoformat()
+            
+            # Bind per-message callables and constants once for the drain loop
+            new_md = pymqi.MD
+            get_message = queue.get
+            append_message = messages.append
+            mq_error = pymqi.MQMIError
+            no_msg_available = pymqi.CMQC.MQRC_NO_MSG_AVAILABLE
+            
             message_count = 0
-            while True:
-                try:
-                    # Reset message descriptor for each message
-                    md = pymqi.MD()
-                    
-                    # Get message
-                    message = queue.get(None, md, gmo)
-                    message_count += 1
-                    
-                    # Parse the message
-                    parsed_data = self._parse_accounting_message(message, md)
-                    if parsed_data:
-                        accounting_data.append(parsed_data)
+            try:
+                while True:
+                    try:
+                        # Reset message descriptor for each message
+                        md = new_md()
                         
-                except pymqi.MQMIError as e:
-                    if e.reason == pymqi.CMQC.MQRC_NO_MSG_AVAILABLE:
-                        break  # No more messages
-                    else:
-                        self.logger.error("Error reading accounting message: %s", e)
-                        break
-            
-            queue.close()
-            self.logger.info("Read %d accounting messages", message_count)
+                        # Get message
+                        message = get_message(None, md, gmo)
+                        message_count += 1
+                        
+                        # Parse the message
+                        parsed_data = parse_message(message, md, timestamp)
+                        if parsed_data:
+                            append_message(parsed_data)
+                            
+                    except mq_error as e:
+                        if e.reason == no_msg_available:
+                            break  # No more messages
+                        else:
+                            self.logger.error("Error reading %s message: %s", kind, e)
+                            break
+            finally:
+                queue.close()
+            self.logger.info("Read %d %s messages", message_count, kind)
             
         except pymqi.MQMIError as e:
-            self.logger.error("Failed to read accounting queue: %s", e)
+            self.logger.error("Failed to read %s queue: %s", kind, e)
         except (ValueError, TypeError) as e:
-            self.logger.error("Data parsing error reading accounting: %s", e)
+            self.logger.error("Data parsing error reading %s: %s", kind, e)
         
-        return accounting_data
+        return messages
     
-    def _parse_statistics_message(self, message: bytes, md: pymqi.MD) -> Optional[Dict[str, Any]]:
+    def _parse_statistics_message(self, message: bytes, md: pymqi.MD,
+                                  timestamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Parse a statistics message and extract relevant information"""
         try:
-            # Get current timestamp
-            timestamp = datetime.now(timezone.utc).isoformat()
+            # Use the drain's collection timestamp when one is supplied
+            if timestamp is None:
+                timestamp = datetime.now(timezone.utc).isoformat()
             
             # Basic message info
             parsed_data = {
@@ -236,11 +247,13 @@ class MQStatsReader:
             self.logger.error("Error parsing statistics message: %s", e)
             return None
     
-    def _parse_accounting_message(self, message: bytes, md: pymqi.MD) -> Optional[Dict[str, Any]]:
+    def _parse_accounting_message(self, message: bytes, md: pymqi.MD,
+                                  timestamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Parse an accounting message and extract relevant information"""
         try:
-            # Get current timestamp
-            timestamp = datetime.now(timezone.utc).isoformat()
+            # Use the drain's collection timestamp when one is supplied
+            if timestamp is None:
+                timestamp = datetime.now(timezone.utc).isoformat()
             
             # Basic message info
             parsed_data = {
@@ -260,55 +273,55 @@ class MQStatsReader:
                 parsed_data["pcf_data"] = pcf_data
                 
                 # Extract queue operations and connection info
-                queue_ops = self.pcf_parser.extract_queue_operations(pcf_data)
-                conn_info = self.pcf_parser.extract_connection_info(pcf_data)
+                queue_ops, conn_info = self.pcf_parser.extract_accounting_info(pcf_data)
                 
                 parsed_data["queue_operations"] = queue_ops
                 parsed_data["connection_info"] = conn_info
                 
                 # Enhanced extraction for application tags and client IPs
-                try:
-                    from enhanced_pcf_extractor import EnhancedPCFExtractor
-                    extractor = EnhancedPCFExtractor()
-                    enhanced_info = extractor.extract_application_info(message)
-                    
-                    if enhanced_info['raw_data_found']:
-                        # Update connection info with enhanced data
-                        parsed_data["connection_info"].update({
-                            "application_name": enhanced_info.get('application_name', 'unknown'),
-                            "client_ip": enhanced_info.get('client_ip', 'unknown'),
-                            "connection_name": enhanced_info.get('connection_name', 'unknown'),
-                            "extraction_method": enhanced_info.get('extraction_method', 'none')
-                        })
+                if self._enhanced_extractor is None:
+                    self.logger.warning("Enhanced PCF extractor not available")
+                else:
+                    try:
+                        enhanced_info = self._enhanced_extractor.extract_application_info(message)
                         
-                        # Update queue operations with reader/writer info
-                        app_name = enhanced_info.get('application_name', 'unknown')
-                        if app_name != 'unknown':
-                            # Determine reader/writer status based on operations
-                            operations = parsed_data.get("operations", {})
-                            put_count = operations.get("put_count", 0)
-                            get_count = operations.get("get_count", 0)
-                            
-                            parsed_data["queue_operations"].update({
-                                "has_readers": get_count > 0,
-                                "has_writers": put_count > 0
+                        if enhanced_info['raw_data_found']:
+                            # Update connection info with enhanced data
+                            parsed_data["connection_info"].update({
+                                "application_name": enhanced_info.get('application_name', 'unknown'),
+                                "client_ip": enhanced_info.get('client_ip', 'unknown'),
+                                "connection_name": enhanced_info.get('connection_name', 'unknown'),
+                                "extraction_method": enhanced_info.get('extraction_method', 'none')
                             })
                             
-                        self.logger.debug(f"Enhanced extraction successful: {app_name} from {enhanced_info.get('client_ip', 'unknown')}")
-                    
-                except ImportError:
-                    self.logger.warning("Enhanced PCF extractor not available")
-                except Exception as e:
-                    self.logger.warning(f"Enhanced extraction failed: {e}")
+                            # Update queue operations with reader/writer info
+                            app_name = enhanced_info.get('application_name', 'unknown')
+                            if app_name != 'unknown':
+                                # Determine reader/writer status based on operations
+                                operations = parsed_data.get("operations", {})
+                                put_count = operations.get("put_count", 0)
+                                get_count = operations.get("get_count", 0)
+                                
+                                parsed_data["queue_operations"].update({
+                                    "has_readers": get_count > 0,
+                                    "has_writers": put_count > 0
+                                })
+                                
+                            self.logger.debug("Enhanced extraction successful: %s from %s",
+                                              app_name, enhanced_info.get('client_ip', 'unknown'))
+                        
+                    except Exception as e:
+                        self.logger.warning("Enhanced extraction failed: %s", e)
                 
-                # Legacy format for compatibility
-                parsed_data["connection_info_legacy"] = {
-                    "has_readers": queue_ops.get('has_readers', False),
-                    "has_writers": queue_ops.get('has_writers', False),
-                    "connection_name": conn_info.get('connection_name', 'unknown'),
-                    "application_name": conn_info.get('application_name', 'unknown'),
-                    "channel_name": conn_info.get('channel_name', 'unknown')
-                }
+                # Legacy format for compatibility, only built for consumers that still read it
+                if STATS_CONFIG.get("include_legacy_connection_info", False):
+                    parsed_data["connection_info_legacy"] = {
+                        "has_readers": queue_ops.get('has_readers', False),
+                        "has_writers": queue_ops.get('has_writers', False),
+                        "connection_name": conn_info.get('connection_name', 'unknown'),
+                        "application_name": conn_info.get('application_name', 'unknown'),
+                        "channel_name": conn_info.get('channel_name', 'unknown')
+                    }
                 parsed_data["operations"] = {
                     "get_count": queue_ops.get('get_count', 0),
                     "put_count": queue_ops.get('put_count', 0),
@@ -334,10 +347,15 @@ class MQStatsReader:
     
     def _identify_statistics_type(self, message: bytes) -> str:
         """Identify the type of statistics message"""
-        # This is a simplified implementation
-        # In a production environment, you would parse the PCF parameters properly
+        # Read the command code from the PCF header when one is present; the
+        # message may be in either big-endian or native little-endian encoding
+        if len(message) >= _PCF_PREFIX_BE.size:
+            for prefix in (_PCF_PREFIX_BE, _PCF_PREFIX_LE):
+                structure_type, _, _, command = prefix.unpack_from(message)
+                if structure_type <= 0xFFFF and command in _STATISTICS_COMMAND_TYPES:
+                    return _STATISTICS_COMMAND_TYPES[command]
         
-        # Check for common statistics types based on message content patterns
+        # Otherwise check for common statistics types based on message content patterns
         message_str = message.hex().upper()
         
         if "515441545354495155455545" in message_str:  # "STATSQUEUE" in hex
@@ -429,9 +447,11 @@ class MQStatsReader:
         if accounting_data is None:
             accounting_data = []
             
+        collected_at = datetime.now(timezone.utc)
         output_data = {
             "collection_info": {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": collected_at.isoformat(),
+                "timestamp_epoch": collected_at.timestamp(),
                 "queue_manager": MQ_CONFIG["queue_manager"],
                 "channel": MQ_CONFIG["channel"],
                 "statistics_count": len(statistics_data),
@@ -468,41 +488,36 @@ class MQStatsReader:
     
     def _generate_summary(self, statistics_data: List[Dict], accounting_data: List[Dict]) -> Dict[str, Any]:
         """Generate a summary of the collected data"""
-        summary = {
-            "total_messages": len(statistics_data) + len(accounting_data),
-            "readers_identified": 0,
-            "writers_identified": 0,
-            "queue_operations": {
-                "total_gets": 0,
-                "total_puts": 0,
-                "total_browses": 0
-            },
-            "active_connections": set(),
-            "statistics_types": {}
-        }
-        
-        # Analyze accounting data for readers/writers
+        # Analyze accounting data for readers/writers in a single pass,
+        # accumulating into locals instead of the nested summary dict
+        readers = writers = total_gets = total_puts = total_browses = 0
         for acc_msg in accounting_data:
             conn_info = acc_msg.get("connection_info", {})
             if conn_info.get("has_readers"):
-                summary["readers_identified"] += 1
+                readers += 1
             if conn_info.get("has_writers"):
-                summary["writers_identified"] += 1
+                writers += 1
             
             operations = acc_msg.get("operations", {})
-            summary["queue_operations"]["total_gets"] += operations.get("get_count", 0)
-            summary["queue_operations"]["total_puts"] += operations.get("put_count", 0)
-            summary["queue_operations"]["total_browses"] += operations.get("browse_count", 0)
+            total_gets += operations.get("get_count", 0)
+            total_puts += operations.get("put_count", 0)
+            total_browses += operations.get("browse_count", 0)
         
         # Analyze statistics data
-        for stat_msg in statistics_data:
-            stat_type = stat_msg.get("statistics_type", "unknown")
-            summary["statistics_types"][stat_type] = summary["statistics_types"].get(stat_type, 0) + 1
-        
-        # Convert set to list for JSON serialization
-        summary["active_connections"] = list(summary["active_connections"])
+        statistics_types = Counter(stat_msg.get("statistics_type", "unknown") for stat_msg in statistics_data)
         
-        return summary
+        return {
+            "total_messages": len(statistics_data) + len(accounting_data),
+            "readers_identified": readers,
+            "writers_identified": writers,
+            "queue_operations": {
+                "total_gets": total_gets,
+                "total_puts": total_puts,
+                "total_browses": total_browses
+            },
+            "active_connections": [],
+            "statistics_types": dict(statistics_types)
+        }
     
     def get_raw_data_structure(self, statistics_data: List[Dict], accounting_data: List[Dict]) -> Dict[str, Any]:
         """
@@ -511,8 +526,10 @@ class MQStatsReader:
         This method returns the same data structure as format_output but as a dictionary
         instead of JSON string, allowing external formatters to process the data.
         """
+        collected_at = datetime.now()
         collection_info = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": collected_at.isoformat(),
+            "timestamp_epoch": collected_at.timestamp(),
             "queue_manager": MQ_CONFIG["queue_manager"],
             "channel": MQ_CONFIG["channel"], 
             "statistics_count": len(statistics_data),
@@ -526,6 +543,24 @@ class MQStatsReader:
             "summary": self._generate_summary(statistics_data, accounting_data)
         }
     
+    def drain_queues(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Read the statistics and accounting queues, concurrently if configured"""
+        if not STATS_CONFIG.get("parallel_drain", False):
+            self.logger.info("Reading statistics queue...")
+            statistics_data = self.read_statistics_queue()
+            
+            self.logger.info("Reading accounting queue...")
+            accounting_data = self.read_accounting_queue()
+            return statistics_data, accounting_data
+        
+        # Both workers share one HANDLE_SHARE_BLOCK connection, so MQ serializes their
+        # MQGETs; only the parsing of one queue's messages overlaps the other's gets
+        self.logger.info("Reading statistics and accounting queues in parallel...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            statistics_future = executor.submit(self.read_statistics_queue)
+            accounting_future = executor.submit(self.read_accounting_queue)
+            return statistics_future.result(), accounting_future.result()
+    
     def run(self) -> Optional[str]:
         """Main execution method"""
         self.logger.info("Starting MQ Statistics and Accounting Reader")
@@ -536,11 +571,7 @@ class MQStatsReader:
         
         try:
             # Read statistics and accounting data
-            self.logger.info("Reading statistics queue...")
-            statistics_data = self.read_statistics_queue()
-            
-            self.logger.info("Reading accounting queue...")
-            accounting_data = self.read_accounting_queue()
+            statistics_data, accounting_data = self.drain_queues()
             
             # Reset statistics if configured
             if STATS_CONFIG.get("reset_after_read", False):
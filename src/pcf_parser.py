@@ -6,7 +6,9 @@ PCF messages contain structured data about MQ operations, connections, and stati
 """
 
 import struct
-from typing import Dict, Any, List, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 try:
     from . import mq_constants as mqc
@@ -15,6 +17,92 @@ except ImportError:
     import mq_constants as mqc
 
 
+# PCF header (MQCFH): nine big-endian MQLONG fields
+_HEADER_STRUCT = struct.Struct('>9L')
+# Parameter header (identifier, type) and single MQLONG fields
+_PARAM_HEADER_STRUCT = struct.Struct('>LL')
+_U32_STRUCT = struct.Struct('>L')
+# Complete MQCFIN integer parameter: identifier, type, value
+_INTEGER_PARAM_STRUCT = struct.Struct('>3L')
+
+
+@lru_cache(maxsize=64)
+def _integer_list_struct(count: int) -> struct.Struct:
+    """Struct decoding an MQCFIL value array of count elements in one call"""
+    return struct.Struct(f'>{count}L')
+
+
+# extract_queue_operations fields: parameter name -> (operations key, PCF type, converter).
+# Where a name used to appear under several keys the first match is kept.
+_QUEUE_OPERATION_FIELDS = {
+    'MQCA_Q_NAME': ('queue_name', mqc.MQCFT_STRING, str.strip),
+    'MQIA_GET_COUNT': ('get_count', mqc.MQCFT_INTEGER, None),
+    'MQIAMO_GETS': ('get_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_MSG_DEQ_COUNT': ('get_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_PUT_COUNT': ('put_count', mqc.MQCFT_INTEGER, None),
+    'MQIAMO_PUTS': ('put_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_MSG_ENQ_COUNT': ('put_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_BROWSE_COUNT': ('browse_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_OPEN_INPUT_COUNT': ('open_input_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_OPEN_OUTPUT_COUNT': ('open_output_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_CURRENT_Q_DEPTH': ('current_depth', mqc.MQCFT_INTEGER, None),
+    'MQIA_MAX_Q_DEPTH': ('max_depth', mqc.MQCFT_INTEGER, None),
+    'MQIA_PUT_BYTES': ('put_bytes', mqc.MQCFT_INTEGER, None),
+    'MQIAMO_PUT_BYTES': ('put_bytes', mqc.MQCFT_INTEGER, None),
+    'MQIA_GET_BYTES': ('get_bytes', mqc.MQCFT_INTEGER, None),
+    'MQIAMO_GET_BYTES': ('get_bytes', mqc.MQCFT_INTEGER, None),
+    'MQIA_PUT_TIME': ('put_time', mqc.MQCFT_INTEGER, None),
+    'MQIA_GET_TIME': ('get_time', mqc.MQCFT_INTEGER, None),
+}
+
+# extract_connection_info fields, same layout as above
+_CONNECTION_INFO_FIELDS = {
+    'MQCACH_CHANNEL_NAME': ('channel_name', mqc.MQCFT_STRING, str.strip),
+    'MQCA_CHANNEL_NAME': ('channel_name', mqc.MQCFT_STRING, str.strip),
+    'MQCACH_CONNECTION_NAME': ('connection_name', mqc.MQCFT_STRING, str.strip),
+    'MQCA_CONNECTION_NAME': ('connection_name', mqc.MQCFT_STRING, str.strip),
+    'MQCA_APPL_NAME': ('application_name', mqc.MQCFT_STRING, str.strip),
+    'MQCACH_USER_ID': ('user_id', mqc.MQCFT_STRING, str.strip),
+    'MQCA_USER_ID': ('user_id', mqc.MQCFT_STRING, str.strip),
+    'MQIA_CONNECT_COUNT': ('connect_count', mqc.MQCFT_INTEGER, None),
+    'MQIA_DISC_COUNT': ('disconnect_count', mqc.MQCFT_INTEGER, None),
+    'MQIACH_CHANNEL_TYPE': ('channel_type', mqc.MQCFT_INTEGER, mqc.get_channel_type_name),
+    'MQIACH_TRANSPORT_TYPE': ('transport_type', mqc.MQCFT_INTEGER, mqc.get_transport_type_name),
+    'MQIACH_CHANNEL_STATUS': ('channel_status', mqc.MQCFT_INTEGER, mqc.get_channel_status_name),
+}
+
+# Python type of a parsed value, for caller-built parameters without a parameter_type
+_PCF_VALUE_TYPES = {mqc.MQCFT_INTEGER: int, mqc.MQCFT_STRING: str}
+
+
+def _index_fields(fields: Dict[str, tuple], target: int = 0) -> Tuple[Dict[int, tuple], Dict[str, tuple]]:
+    """Tag a field table with the target dict it fills and key it by parameter ID and name"""
+    by_name = {name: (target, key, pcf_type, _PCF_VALUE_TYPES[pcf_type], convert)
+               for name, (key, pcf_type, convert) in fields.items()}
+    by_id = {param_id: by_name[name] for param_id, name in mqc.PARAMETER_NAMES.items() if name in by_name}
+    return by_id, by_name
+
+
+# Keyed by parameter ID so parsed parameters skip the name compare; the name tables
+# serve caller-built parameters. The accounting tables fill both dicts in one walk.
+_QUEUE_OPERATION_IDS, _QUEUE_OPERATION_NAMES = _index_fields(_QUEUE_OPERATION_FIELDS)
+_CONNECTION_INFO_IDS, _CONNECTION_INFO_NAMES = _index_fields(_CONNECTION_INFO_FIELDS)
+_ACCOUNTING_CONNECTION_IDS, _ACCOUNTING_CONNECTION_NAMES = _index_fields(_CONNECTION_INFO_FIELDS, 1)
+_ACCOUNTING_IDS = {**_QUEUE_OPERATION_IDS, **_ACCOUNTING_CONNECTION_IDS}
+_ACCOUNTING_NAMES = {**_QUEUE_OPERATION_NAMES, **_ACCOUNTING_CONNECTION_NAMES}
+
+# Low-cardinality string parameters that repeat across the messages of a drain. Only
+# these are interned: interned strings live for the process, so connection names,
+# dates and other per-message values must stay out of this set.
+_INTERNED_STRING_IDS = frozenset({
+    mqc.MQCA_Q_NAME,
+    mqc.MQCA_Q_MGR_NAME,
+    mqc.MQCA_CHANNEL_NAME,
+    mqc.MQCA_APPL_NAME,
+    mqc.MQCA_USER_ID,
+})
+
+
 class PCFParser:
     """Parser for IBM MQ PCF (Programmable Command Format) messages"""
     
@@ -24,6 +112,13 @@ class PCFParser:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Value parsers by parameter type (MQCFIN, MQCFST, MQCFBS, MQCFIL)
+        self._type_handlers = {
+            mqc.MQCFT_INTEGER: self._parse_integer_parameter,
+            mqc.MQCFT_STRING: self._parse_string_parameter,
+            mqc.MQCFT_BYTE_STRING: self._parse_byte_string_parameter,
+            mqc.MQCFT_INTEGER_LIST: self._parse_integer_list_parameter
+        }
     
     def parse_message(self, message) -> Optional[Dict[str, Any]]:
         """Parse a complete PCF message (bytes or dict)"""
@@ -36,14 +131,15 @@ class PCFParser:
             return None
         
         try:
-            # Parse PCF header
-            header = self._parse_pcf_header(message[:self.PCF_HEADER_SIZE])
+            # Parse PCF header in place, without copying the first 36 bytes
+            view = memoryview(message)
+            header = self._parse_pcf_header(view)
             if not header:
                 return None
             
             # Parse parameters with enhanced error handling
             parameters = self._parse_pcf_parameters(
-                message[self.PCF_HEADER_SIZE:], 
+                view[self.PCF_HEADER_SIZE:], 
                 header.get('parameter_count', 0)
             )
             
@@ -63,7 +159,8 @@ class PCFParser:
         processed = {
             'message_type': message_dict.get('message_type', 'unknown'),
             'parameters': message_dict.get('parameters', {}),
-            'message_size': len(str(message_dict))
+            # There is no wire size for pre-parsed input; keep one the caller recorded
+            'message_size': message_dict.get('message_size', 0)
         }
         
         # Convert parameters dict to list format if needed
@@ -93,7 +190,7 @@ class PCFParser:
             return mqc.MQCFT_NONE
     
     def _parse_pcf_header(self, header_bytes: bytes) -> Optional[Dict[str, Any]]:
-        """Parse PCF message header"""
+        """Parse PCF message header from the start of a buffer"""
         try:
             # PCF header format (36 bytes):
             # Bytes 0-3: Structure type (MQLONG)
@@ -106,7 +203,7 @@ class PCFParser:
             # Bytes 28-31: Reason code (MQLONG)
             # Bytes 32-35: Parameter count (MQLONG)
             
-            values = struct.unpack('>9L', header_bytes)
+            values = _HEADER_STRUCT.unpack_from(header_bytes)
             
             header = {
                 'structure_type': values[0],
@@ -149,22 +246,42 @@ class PCFParser:
         offset = 0
         parsed_count = 0
         max_reasonable_params = min(param_count, 1000)  # Safety limit
+        end = len(param_bytes)
+        unpack_integer = _INTEGER_PARAM_STRUCT.unpack_from
+        integer_type = mqc.MQCFT_INTEGER
+        get_name = mqc.get_parameter_name
         
-        while parsed_count < max_reasonable_params and offset < len(param_bytes):
+        while parsed_count < max_reasonable_params and offset < end:
             # Ensure we have enough bytes for parameter header
-            if offset + self.PCF_PARAMETER_HEADER_SIZE > len(param_bytes):
-                self.logger.debug(f"Not enough bytes for parameter header at offset {offset}")
+            if offset + self.PCF_PARAMETER_HEADER_SIZE > end:
+                self.logger.debug("Not enough bytes for parameter header at offset %d", offset)
                 break
             
+            # Fast path for integer parameters, which make up most of a statistics message
+            if offset + 12 <= end:
+                param_id, param_type, value = unpack_integer(param_bytes, offset)
+                if param_type == integer_type:
+                    if param_id <= 0xFFFFFF:
+                        parameters.append({
+                            'parameter_id': param_id,
+                            'parameter_type': param_type,
+                            'parameter_name': get_name(param_id),
+                            'value': value,
+                            'total_length': 12
+                        })
+                    offset += 12
+                    parsed_count += 1
+                    continue
+            
             # Parse single parameter with validation
-            param = self._parse_single_parameter(param_bytes[offset:])
+            param = self._parse_single_parameter(param_bytes, offset)
             if param:
                 # Validate parameter structure
                 param_length = param.get('total_length', self.PCF_PARAMETER_HEADER_SIZE)
                 
                 # Sanity check parameter length
-                if param_length < self.PCF_PARAMETER_HEADER_SIZE or param_length > len(param_bytes) - offset:
-                    self.logger.warning(f"Invalid parameter length {param_length} at offset {offset}")
+                if param_length < self.PCF_PARAMETER_HEADER_SIZE or param_length > end - offset:
+                    self.logger.warning("Invalid parameter length %d at offset %d", param_length, offset)
                     break
                 
                 # Only add valid parameters (skip obviously corrupted ones)
@@ -176,14 +293,14 @@ class PCFParser:
             else:
                 # Try to skip to next 4-byte boundary in case of alignment issues
                 offset = ((offset + 3) // 4) * 4 + 4
-                if offset >= len(param_bytes):
+                if offset >= end:
                     break
         
         return parameters
     
-    def _parse_single_parameter(self, param_bytes: bytes) -> Optional[Dict[str, Any]]:
-        """Parse a single PCF parameter with enhanced validation"""
-        if len(param_bytes) < self.PCF_PARAMETER_HEADER_SIZE:
+    def _parse_single_parameter(self, param_bytes: bytes, offset: int = 0) -> Optional[Dict[str, Any]]:
+        """Parse a single PCF parameter starting at offset with enhanced validation"""
+        if len(param_bytes) - offset < self.PCF_PARAMETER_HEADER_SIZE:
             return None
         
         try:
@@ -191,7 +308,7 @@ class PCFParser:
             # Bytes 0-3: Parameter identifier (MQLONG)
             # Bytes 4-7: Parameter type (MQLONG)
             
-            param_id, param_type = struct.unpack('>LL', param_bytes[:8])
+            param_id, param_type = _PARAM_HEADER_STRUCT.unpack_from(param_bytes, offset)
             
             # Skip obviously corrupted parameters (common corruption patterns)
             if param_id == 0 and param_type == 0:
@@ -204,27 +321,29 @@ class PCFParser:
                        'parameter_name': mqc.get_parameter_name(param_id), 
                        'value': f'corrupt_type_{param_type}', 'total_length': 8}
             
-            parameter = {
-                'parameter_id': param_id,
-                'parameter_type': param_type,
-                'parameter_name': mqc.get_parameter_name(param_id)
-            }
-            
             # Parse parameter value based on type with better error handling
-            if param_type == mqc.MQCFT_INTEGER:
-                parameter.update(self._parse_integer_parameter(param_bytes))
-            elif param_type == mqc.MQCFT_STRING:
-                parameter.update(self._parse_string_parameter(param_bytes))
-            elif param_type == mqc.MQCFT_BYTE_STRING:
-                parameter.update(self._parse_byte_string_parameter(param_bytes))
-            elif param_type == mqc.MQCFT_INTEGER_LIST:
-                parameter.update(self._parse_integer_list_parameter(param_bytes))
+            handler = self._type_handlers.get(param_type)
+            if handler is not None:
+                parsed = handler(param_bytes, offset)
             else:
                 # Handle unknown but potentially valid parameter types
-                parameter['value'] = f'unsupported_type_{param_type}'
-                parameter['total_length'] = max(self.PCF_PARAMETER_HEADER_SIZE, 12)  # Minimum safe length
+                parsed = {
+                    'value': f'unsupported_type_{param_type}',
+                    'total_length': max(self.PCF_PARAMETER_HEADER_SIZE, 12)  # Minimum safe length
+                }
             
-            return parameter
+            value = parsed['value']
+            if param_type == mqc.MQCFT_STRING and param_id in _INTERNED_STRING_IDS:
+                value = sys.intern(value)
+            
+            # Build the record in one literal instead of growing it with update()
+            return {
+                'parameter_id': param_id,
+                'parameter_type': param_type,
+                'parameter_name': mqc.get_parameter_name(param_id),
+                'value': value,
+                'total_length': parsed['total_length']
+            }
             
         except struct.error as e:
             self.logger.debug("Error parsing PCF parameter: %s", e)
@@ -233,50 +352,41 @@ class PCFParser:
             self.logger.warning("Unexpected error parsing parameter: %s", e)
             return None
     
-    def _parse_integer_parameter(self, param_bytes: bytes) -> Dict[str, Any]:
+    def _parse_integer_parameter(self, param_bytes: bytes, offset: int = 0) -> Dict[str, Any]:
         """Parse integer parameter (12 bytes total) with validation"""
         # Integer parameter: 8-byte header + 4-byte value
-        try:
-            if len(param_bytes) >= 12:
-                value = struct.unpack('>L', param_bytes[8:12])[0]
-                return {'value': value, 'total_length': 12}
-            else:
-                self.logger.debug("Integer parameter too short")
-                return {'value': 0, 'total_length': 12}
-        except struct.error as e:
-            self.logger.debug(f"Error parsing integer parameter: {e}")
-            return {'value': 0, 'total_length': 12}
+        if len(param_bytes) - offset >= 12:
+            value = _U32_STRUCT.unpack_from(param_bytes, offset + 8)[0]
+            return {'value': value, 'total_length': 12}
+        self.logger.debug("Integer parameter too short")
+        return {'value': 0, 'total_length': 12}
     
-    def _parse_string_parameter(self, param_bytes: bytes) -> Dict[str, Any]:
+    def _parse_string_parameter(self, param_bytes: bytes, offset: int = 0) -> Dict[str, Any]:
         """Parse string parameter with enhanced validation"""
-        if len(param_bytes) >= 12:
+        available = len(param_bytes) - offset
+        if available >= 12:
             # String parameter: 8-byte header + 4-byte length + string data
             try:
-                str_length = struct.unpack('>L', param_bytes[8:12])[0]
+                str_length = _U32_STRUCT.unpack_from(param_bytes, offset + 8)[0]
                 
                 # Validate string length is reasonable
                 if str_length > 65536:  # 64KB limit for strings
                     return {'value': f'invalid_string_length_{str_length}', 'total_length': 12}
                 
-                # Ensure we have enough data
+                # Ensure we have enough data; this also covers the unpadded string bytes
                 total_length = 12 + ((str_length + 3) // 4) * 4  # 4-byte aligned
-                if len(param_bytes) < total_length:
+                if available < total_length:
                     return {'value': 'truncated_string', 'total_length': 12}
                 
-                if str_length > 0 and len(param_bytes) >= 12 + str_length:
+                if str_length > 0:
+                    # Strip MQ's blank/null padding before decoding so it is never decoded
+                    data = bytes(param_bytes[offset + 12:offset + 12 + str_length]).rstrip(b'\x00 ')
                     try:
-                        # Try UTF-8 first
-                        value = param_bytes[12:12+str_length].decode('utf-8').rstrip('\x00 ')
-                        return {'value': value, 'total_length': total_length}
+                        value = data.decode('utf-8')
                     except UnicodeDecodeError:
-                        try:
-                            # Try latin-1 if utf-8 fails
-                            value = param_bytes[12:12+str_length].decode('latin-1').rstrip('\x00 ')
-                            return {'value': value, 'total_length': total_length}
-                        except UnicodeDecodeError:
-                            # Last resort: escape invalid bytes
-                            value = param_bytes[12:12+str_length].decode('utf-8', errors='replace').rstrip('\x00 ')
-                            return {'value': value, 'total_length': total_length}
+                        # latin-1 maps every byte, so this fallback cannot fail
+                        value = data.decode('latin-1')
+                    return {'value': value, 'total_length': total_length}
                 else:
                     return {'value': '', 'total_length': total_length}
                     
@@ -285,30 +395,28 @@ class PCFParser:
         
         return {'value': '', 'total_length': 12}
     
-    def _parse_byte_string_parameter(self, param_bytes: bytes) -> Dict[str, Any]:
+    def _parse_byte_string_parameter(self, param_bytes: bytes, offset: int = 0) -> Dict[str, Any]:
         """Parse byte string parameter"""
-        if len(param_bytes) >= 12:
-            data_length = struct.unpack('>L', param_bytes[8:12])[0]
+        available = len(param_bytes) - offset
+        if available >= 12:
+            data_length = _U32_STRUCT.unpack_from(param_bytes, offset + 8)[0]
             total_length = 12 + data_length
             
-            if len(param_bytes) >= total_length:
-                value = param_bytes[12:12+data_length]
+            if available >= total_length:
+                value = param_bytes[offset + 12:offset + total_length]
                 return {'value': value.hex(), 'total_length': total_length}
         
         return {'value': '', 'total_length': 12}
     
-    def _parse_integer_list_parameter(self, param_bytes: bytes) -> Dict[str, Any]:
+    def _parse_integer_list_parameter(self, param_bytes: bytes, offset: int = 0) -> Dict[str, Any]:
         """Parse integer list parameter"""
-        if len(param_bytes) >= 12:
-            count = struct.unpack('>L', param_bytes[8:12])[0]
+        available = len(param_bytes) - offset
+        if available >= 12:
+            count = _U32_STRUCT.unpack_from(param_bytes, offset + 8)[0]
             total_length = 12 + (count * 4)
             
-            if len(param_bytes) >= total_length:
-                values = []
-                for i in range(count):
-                    offset = 12 + (i * 4)
-                    value = struct.unpack('>L', param_bytes[offset:offset+4])[0]
-                    values.append(value)
+            if available >= total_length:
+                values = list(_integer_list_struct(count).unpack_from(param_bytes, offset + 12))
                 return {'value': values, 'total_length': total_length}
         
         return {'value': [], 'total_length': 12}
@@ -346,7 +454,46 @@ class PCFParser:
     
     def extract_queue_operations(self, parsed_message: Dict[str, Any]) -> Dict[str, Any]:
         """Extract queue operation statistics from parsed message"""
-        operations = {
+        operations = self._new_queue_operations()
+        
+        if not parsed_message or 'parameters' not in parsed_message:
+            return operations
+        
+        self._apply_parameter_fields(parsed_message['parameters'], (operations,),
+                                     _QUEUE_OPERATION_IDS, _QUEUE_OPERATION_NAMES)
+        self._set_reader_writer_flags(operations)
+        
+        return operations
+    
+    def extract_connection_info(self, parsed_message: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract connection information from parsed message"""
+        connection_info = self._new_connection_info()
+        
+        if not parsed_message or 'parameters' not in parsed_message:
+            return connection_info
+        
+        self._apply_parameter_fields(parsed_message['parameters'], (connection_info,),
+                                     _CONNECTION_INFO_IDS, _CONNECTION_INFO_NAMES)
+        
+        return connection_info
+    
+    def extract_accounting_info(self, parsed_message: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Extract queue operations and connection information in a single walk of the parameters"""
+        operations = self._new_queue_operations()
+        connection_info = self._new_connection_info()
+        
+        if not parsed_message or 'parameters' not in parsed_message:
+            return operations, connection_info
+        
+        self._apply_parameter_fields(parsed_message['parameters'], (operations, connection_info),
+                                     _ACCOUNTING_IDS, _ACCOUNTING_NAMES)
+        self._set_reader_writer_flags(operations)
+        
+        return operations, connection_info
+    
+    def _new_queue_operations(self) -> Dict[str, Any]:
+        """Default queue operation values before any parameter is applied"""
+        return {
             'queue_name': 'unknown',
             'get_count': 0,
             'put_count': 0,
@@ -362,64 +509,10 @@ class PCFParser:
             'put_time': 0,
             'get_time': 0
         }
-        
-        if not parsed_message or 'parameters' not in parsed_message:
-            return operations
-        
-        for param in parsed_message['parameters']:
-            param_name = param.get('parameter_name', '')
-            value = param.get('value')
-            
-            # Handle different value types safely
-            if value is None:
-                continue
-                
-            try:
-                if param_name == 'MQCA_Q_NAME' and isinstance(value, str):
-                    operations['queue_name'] = value.strip()
-                elif param_name in ['MQIA_GET_COUNT', 'MQIAMO_GETS', 'MQIA_MSG_DEQ_COUNT'] and isinstance(value, int):
-                    operations['get_count'] = value
-                elif param_name in ['MQIA_PUT_COUNT', 'MQIAMO_PUTS', 'MQIA_MSG_ENQ_COUNT'] and isinstance(value, int):
-                    operations['put_count'] = value
-                elif param_name in ['MQIA_BROWSE_COUNT'] and isinstance(value, int):
-                    operations['browse_count'] = value
-                elif param_name in ['MQIA_OPEN_INPUT_COUNT'] and isinstance(value, int):
-                    operations['open_input_count'] = value
-                elif param_name in ['MQIA_OPEN_OUTPUT_COUNT'] and isinstance(value, int):
-                    operations['open_output_count'] = value
-                elif param_name in ['MQIA_MSG_ENQ_COUNT'] and isinstance(value, int):
-                    operations['enqueue_count'] = value
-                elif param_name in ['MQIA_MSG_DEQ_COUNT'] and isinstance(value, int):
-                    operations['dequeue_count'] = value
-                elif param_name in ['MQIA_CURRENT_Q_DEPTH'] and isinstance(value, int):
-                    operations['current_depth'] = value
-                elif param_name in ['MQIA_MAX_Q_DEPTH'] and isinstance(value, int):
-                    operations['max_depth'] = value
-                elif param_name in ['MQIA_PUT_BYTES', 'MQIAMO_PUT_BYTES'] and isinstance(value, int):
-                    operations['put_bytes'] = value
-                elif param_name in ['MQIA_GET_BYTES', 'MQIAMO_GET_BYTES'] and isinstance(value, int):
-                    operations['get_bytes'] = value
-                elif param_name in ['MQIA_PUT_TIME'] and isinstance(value, int):
-                    operations['put_time'] = value
-                elif param_name in ['MQIA_GET_TIME'] and isinstance(value, int):
-                    operations['get_time'] = value
-            except (ValueError, TypeError) as e:
-                self.logger.warning("Error processing parameter %s with value %s: %s", 
-                                  param_name, value, e)
-                continue
-        
-        # Determine if there are readers and writers
-        operations['has_readers'] = (operations['get_count'] > 0 or 
-                                   operations['browse_count'] > 0 or 
-                                   operations['open_input_count'] > 0)
-        operations['has_writers'] = (operations['put_count'] > 0 or 
-                                   operations['open_output_count'] > 0)
-        
-        return operations
     
-    def extract_connection_info(self, parsed_message: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract connection information from parsed message"""
-        connection_info = {
+    def _new_connection_info(self) -> Dict[str, Any]:
+        """Default connection values before any parameter is applied"""
+        return {
             'channel_name': 'unknown',
             'connection_name': 'unknown',
             'application_name': 'unknown',
@@ -430,42 +523,49 @@ class PCFParser:
             'transport_type': 'unknown',
             'channel_status': 'unknown'
         }
-        
-        if not parsed_message or 'parameters' not in parsed_message:
-            return connection_info
-        
-        for param in parsed_message['parameters']:
-            param_name = param.get('parameter_name', '')
-            value = param.get('value')
+    
+    def _set_reader_writer_flags(self, operations: Dict[str, Any]) -> None:
+        """Determine if there are readers and writers"""
+        operations['has_readers'] = (operations['get_count'] > 0 or 
+                                   operations['browse_count'] > 0 or 
+                                   operations['open_input_count'] > 0)
+        operations['has_writers'] = (operations['put_count'] > 0 or 
+                                   operations['open_output_count'] > 0)
+    
+    def _apply_parameter_fields(self, parameters: List[Dict[str, Any]], targets: Tuple[Dict[str, Any], ...],
+                                fields_by_id: Dict[int, tuple], fields_by_name: Dict[str, tuple]) -> None:
+        """Copy the parameters named in a field table into their target dicts, keyed by parameter ID"""
+        field_by_id = fields_by_id.get
+        field_by_name = fields_by_name.get
+        for param in parameters:
+            get = param.get
+            param_id = get('parameter_id')
+            if param_id is not None:
+                field = field_by_id(param_id)
+            else:
+                # Caller-built parameters may only carry a name
+                field = field_by_name(get('parameter_name', ''))
+            if field is None:
+                continue
             
+            target, key, pcf_type, value_type, convert = field
+            value = get('value')
             if value is None:
                 continue
-                
+            
+            # Parsed parameters carry their PCF type; only caller-built ones need isinstance
+            param_type = get('parameter_type')
+            if param_type is not None:
+                if param_type != pcf_type:
+                    continue
+            elif not isinstance(value, value_type):
+                continue
+            
             try:
-                if param_name in ['MQCACH_CHANNEL_NAME', 'MQCA_CHANNEL_NAME'] and isinstance(value, str):
-                    connection_info['channel_name'] = value.strip()
-                elif param_name in ['MQCACH_CONNECTION_NAME', 'MQCA_CONNECTION_NAME'] and isinstance(value, str):
-                    connection_info['connection_name'] = value.strip()
-                elif param_name in ['MQCA_APPL_NAME'] and isinstance(value, str):
-                    connection_info['application_name'] = value.strip()
-                elif param_name in ['MQCACH_USER_ID', 'MQCA_USER_ID'] and isinstance(value, str):
-                    connection_info['user_id'] = value.strip()
-                elif param_name in ['MQIA_CONNECT_COUNT'] and isinstance(value, int):
-                    connection_info['connect_count'] = value
-                elif param_name in ['MQIA_DISC_COUNT'] and isinstance(value, int):
-                    connection_info['disconnect_count'] = value
-                elif param_name in ['MQIACH_CHANNEL_TYPE'] and isinstance(value, int):
-                    connection_info['channel_type'] = self._get_channel_type_name(value)
-                elif param_name in ['MQIACH_TRANSPORT_TYPE'] and isinstance(value, int):
-                    connection_info['transport_type'] = self._get_transport_type_name(value)
-                elif param_name in ['MQIACH_CHANNEL_STATUS'] and isinstance(value, int):
-                    connection_info['channel_status'] = self._get_channel_status_name(value)
+                targets[target][key] = convert(value) if convert else value
             except (ValueError, TypeError) as e:
-                self.logger.warning("Error processing connection parameter %s with value %s: %s", 
-                                  param_name, value, e)
-                continue
-        
-        return connection_info
+                self.logger.warning("Error processing parameter %s with value %s: %s",
+                                    param.get('parameter_name', param_id), value, e)
     
     def _get_channel_type_name(self, channel_type: int) -> str:
         """Convert channel type integer to readable name"""
@@ -29,18 +29,39 @@ ibmmq_mqi_puts_total{queue_manager="PROD_QM",application="OrderService.exe"} 124
 
 import json
 import time
-from typing import Dict, List, Any, Set
+from functools import lru_cache
+from typing import Dict, List, Any, Set, Tuple
 from datetime import datetime
 import logging
 
+try:
+    from enhanced_pcf_extractor import EnhancedPCFExtractor
+except ImportError:
+    EnhancedPCFExtractor = None
+
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4096)
+def _format_label_items(items: Tuple[Tuple[str, str], ...]) -> str:
+    """Format label (name, value) pairs as a sorted Prometheus label set"""
+    
+    label_pairs = []
+    for key, value in sorted(items):
+        # Escape quotes in label values
+        escaped_value = value.replace('"', '\\"')
+        label_pairs.append(f'{key}="{escaped_value}"')
+        
+    return "{" + ",".join(label_pairs) + "}"
+
+
 class PrometheusMetricsExporter:
     """Exports IBM MQ statistics and accounting data in Prometheus format"""
     
     def __init__(self, namespace: str = "ibmmq"):
         self.namespace = namespace
         self.metrics = {}
+        self.extractor = EnhancedPCFExtractor() if EnhancedPCFExtractor is not None else None
         self.help_text = {
             # Queue Metrics
             "queue_depth_current": "Current depth of IBM MQ queue",
@@ -97,6 +118,9 @@ class PrometheusMetricsExporter:
             "statistics_messages_processed": "gauge"
         }
         
+        # HELP/TYPE comment lines per full metric name, filled on first export
+        self._metric_headers: Dict[str, str] = {}
+        
     def process_mq_data(self, data: Dict[str, Any]) -> None:
         """Process IBM MQ statistics and accounting data and generate metrics"""
         logger.info("Processing IBM MQ data for Prometheus export")
@@ -208,85 +232,82 @@ class PrometheusMetricsExporter:
         applications_found = set()
         client_ips_found = set()
         
-        # Use enhanced extractor for better data extraction
-        try:
-            from enhanced_pcf_extractor import EnhancedPCFExtractor
-            extractor = EnhancedPCFExtractor()
-            
-            # Get enhanced analysis of all accounting messages
-            analysis = extractor.extract_reader_writer_info(accounting_data)
-            
-            logger.info(f"Enhanced extraction results: {analysis['extraction_stats']}")
-            
-            # Process applications found
-            for app_name, app_info in analysis['applications'].items():
-                applications_found.add(app_name)
-                client_ip = app_info.get('client_ip', 'unknown')
-                if client_ip != 'unknown':
-                    client_ips_found.add(client_ip)
+        if self.extractor is None:
+            logger.warning("Enhanced PCF extractor not available, using fallback")
+            # Fallback to original processing
+            processed_count = self._process_accounting_fallback(accounting_data, queue_manager)
+        else:
+            # Use enhanced extractor for better data extraction
+            try:
+                # Get enhanced analysis of all accounting messages
+                analysis = self.extractor.extract_reader_writer_info(accounting_data)
                 
-                operations = app_info.get('operations', {})
-                put_count = operations.get('put', 0)
-                get_count = operations.get('get', 0)
+                logger.info(f"Enhanced extraction results: {analysis['extraction_stats']}")
                 
-                # Add operation metrics with actual data
-                if put_count > 0:
-                    self._add_metric("mqi_puts_total", put_count, {
+                # Process applications found
+                for app_name, app_info in analysis['applications'].items():
+                    applications_found.add(app_name)
+                    client_ip = app_info.get('client_ip', 'unknown')
+                    if client_ip != 'unknown':
+                        client_ips_found.add(client_ip)
+                    
+                    operations = app_info.get('operations', {})
+                    put_count = operations.get('put', 0)
+                    get_count = operations.get('get', 0)
+                    
+                    # Add operation metrics with actual data
+                    if put_count > 0:
+                        self._add_metric("mqi_puts_total", put_count, {
+                            "queue_manager": queue_manager,
+                            "application": app_name,
+                            "client_ip": client_ip
+                        })
+                    
+                    if get_count > 0:
+                        self._add_metric("mqi_gets_total", get_count, {
+                            "queue_manager": queue_manager,
+                            "application": app_name,
+                            "client_ip": client_ip
+                        })
+                
+                # Process readers and writers
+                for app_name, app_info in analysis['readers'].items():
+                    client_ip = app_info.get('client_ip', 'unknown')
+                    queue_name = "SYSTEM.DEFAULT.LOCAL.QUEUE"  # Default for now
+                    
+                    self._add_metric("queue_has_readers", 1, {
+                        "queue": queue_name,
                         "queue_manager": queue_manager,
                         "application": app_name,
                         "client_ip": client_ip
                     })
                 
-                if get_count > 0:
-                    self._add_metric("mqi_gets_total", get_count, {
+                for app_name, app_info in analysis['writers'].items():
+                    client_ip = app_info.get('client_ip', 'unknown')
+                    queue_name = "SYSTEM.DEFAULT.LOCAL.QUEUE"  # Default for now
+                    
+                    self._add_metric("queue_has_writers", 1, {
+                        "queue": queue_name,
                         "queue_manager": queue_manager,
                         "application": app_name,
                         "client_ip": client_ip
                     })
-            
-            # Process readers and writers
-            for app_name, app_info in analysis['readers'].items():
-                client_ip = app_info.get('client_ip', 'unknown')
-                queue_name = "SYSTEM.DEFAULT.LOCAL.QUEUE"  # Default for now
                 
-                self._add_metric("queue_has_readers", 1, {
-                    "queue": queue_name,
-                    "queue_manager": queue_manager,
-                    "application": app_name,
-                    "client_ip": client_ip
-                })
-            
-            for app_name, app_info in analysis['writers'].items():
-                client_ip = app_info.get('client_ip', 'unknown')
-                queue_name = "SYSTEM.DEFAULT.LOCAL.QUEUE"  # Default for now
+                # Add connection summary metrics
+                for client_ip, conn_info in analysis['connection_summary'].items():
+                    total_ops = conn_info.get('total_operations', 0)
+                    if total_ops > 0:
+                        self._add_metric("client_total_operations", total_ops, {
+                            "queue_manager": queue_manager,
+                            "client_ip": client_ip,
+                            "connection_name": conn_info.get('connection_name', 'unknown')
+                        })
                 
-                self._add_metric("queue_has_writers", 1, {
-                    "queue": queue_name,
-                    "queue_manager": queue_manager,
-                    "application": app_name,
-                    "client_ip": client_ip
-                })
-            
-            # Add connection summary metrics
-            for client_ip, conn_info in analysis['connection_summary'].items():
-                total_ops = conn_info.get('total_operations', 0)
-                if total_ops > 0:
-                    self._add_metric("client_total_operations", total_ops, {
-                        "queue_manager": queue_manager,
-                        "client_ip": client_ip,
-                        "connection_name": conn_info.get('connection_name', 'unknown')
-                    })
-            
-            processed_count = analysis['extraction_stats']['successful_extractions']
-            
-        except ImportError:
-            logger.warning("Enhanced PCF extractor not available, using fallback")
-            # Fallback to original processing
-            processed_count = self._process_accounting_fallback(accounting_data, queue_manager)
-        
-        except Exception as e:
-            logger.error(f"Enhanced processing failed: {e}")
-            processed_count = self._process_accounting_fallback(accounting_data, queue_manager)
+                processed_count = analysis['extraction_stats']['successful_extractions']
+                
+            except Exception as e:
+                logger.error(f"Enhanced processing failed: {e}")
+                processed_count = self._process_accounting_fallback(accounting_data, queue_manager)
         
         logger.info(f"Processed {processed_count} accounting messages")
         logger.info(f"Applications found: {list(applications_found)}")
@@ -363,9 +384,15 @@ class PrometheusMetricsExporter:
         
         queue_manager = collection_info.get('queue_manager', 'unknown')
         
-        # Last collection timestamp
+        # Last collection timestamp, taken from the epoch value when the reader
+        # supplied one so the ISO string does not have to be parsed back
+        timestamp_epoch = collection_info.get('timestamp_epoch')
         timestamp_str = collection_info.get('timestamp', '')
-        if timestamp_str:
+        if timestamp_epoch is not None:
+            self._add_metric("last_collection_timestamp", int(timestamp_epoch), {
+                "queue_manager": queue_manager
+            })
+        elif timestamp_str:
             try:
                 dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                 timestamp = int(dt.timestamp())
@@ -403,42 +430,51 @@ class PrometheusMetricsExporter:
         """Export metrics in Prometheus text format"""
         
         output_lines = []
+        append = output_lines.append
+        format_labels = self._format_labels
         
         for metric_name, metric_entries in self.metrics.items():
-            # Remove namespace prefix for help lookup
-            base_name = metric_name.replace(f"{self.namespace}_", "")
-            
-            # Add HELP comment
-            help_text = self.help_text.get(base_name, f"IBM MQ metric {base_name}")
-            output_lines.append(f"# HELP {metric_name} {help_text}")
-            
-            # Add TYPE comment  
-            metric_type = self.metric_types.get(base_name, "gauge")
-            output_lines.append(f"# TYPE {metric_name} {metric_type}")
+            # Add HELP and TYPE comments
+            append(self._metric_header(metric_name))
             
             # Add metric entries
             for entry in metric_entries:
-                labels_str = self._format_labels(entry['labels'])
-                output_lines.append(f"{metric_name}{labels_str} {entry['value']}")
+                labels_str = format_labels(entry['labels'])
+                append(f"{metric_name}{labels_str} {entry['value']}")
             
             # Add blank line between metrics
-            output_lines.append("")
+            append("")
             
         return '\n'.join(output_lines)
         
+    def _metric_header(self, metric_name: str) -> str:
+        """Return the HELP and TYPE comment lines for a metric, built once per name"""
+        
+        header = self._metric_headers.get(metric_name)
+        if header is None:
+            # Remove namespace prefix for help lookup
+            base_name = metric_name.replace(f"{self.namespace}_", "")
+            help_text = self.help_text.get(base_name, f"IBM MQ metric {base_name}")
+            metric_type = self.metric_types.get(base_name, "gauge")
+            header = f"# HELP {metric_name} {help_text}\n# TYPE {metric_name} {metric_type}"
+            self._metric_headers[metric_name] = header
+        return header
+        
     def _format_labels(self, labels: Dict[str, str]) -> str:
         """Format labels for Prometheus output"""
         
         if not labels:
             return ""
             
-        label_pairs = []
-        for key, value in sorted(labels.items()):
-            # Escape quotes in label values
-            escaped_value = str(value).replace('"', '\\"')
-            label_pairs.append(f'{key}="{escaped_value}"')
-            
-        return "{" + ",".join(label_pairs) + "}"
+        # The same label sets recur across queues and scrapes. Label values are
+        # nearly always strings already; anything else is keyed by its string
+        # form, since lru_cache treats 1, 1.0 and True as the same key
+        items = tuple(labels.items())
+        for _, value in items:
+            if type(value) is not str:
+                items = tuple((key, str(value)) for key, value in items)
+                break
+        return _format_label_items(items)
         
     def export_json_format(self) -> Dict[str, Any]:
         """Export metrics in JSON format for debugging"""
@@ -460,7 +496,7 @@ class PrometheusMetricsExporter:
             
         if json_file:
             with open(json_file, 'w') as f:
-                json.dump(self.export_json_format(), f, indent=2)
+                f.write(json.dumps(self.export_json_format(), indent=2))
             logger.info(f"JSON metrics saved to {json_file}")
 
 def create_prometheus_metrics(mq_data: Dict[str, Any]) -> str:
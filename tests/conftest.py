@@ -17,6 +17,7 @@ class MockPymqi:
         # Connection constants
         MQCHT_CLNTCONN = 6
         MQXPT_TCP = 1
+        MQCNO_HANDLE_SHARE_BLOCK = 0x00000040
         
         # Queue constants
         MQOO_OUTPUT = 0x00000010
@@ -104,7 +105,7 @@ class MockPymqi:
             self.name = name
             self._connected = False
         
-        def connect_with_options(self, qm_name, cd):  # pylint: disable=unused-argument
+        def connect_with_options(self, qm_name, cd=None, **kwargs):  # pylint: disable=unused-argument
             self._connected = True
         
         def disconnect(self):
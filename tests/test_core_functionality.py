@@ -114,7 +114,21 @@ class TestPrometheusExporter(unittest.TestCase):
         
         self.assertIn('app="test\\"app"', formatted)
         self.assertIn('ip="127.0.0.1"', formatted)
-    
+
+    def test_label_formatting_ignores_insertion_order(self):
+        """Test label sets built in different orders format identically"""
+        first = self.exporter._format_labels({"queue": "Q1", "application": "app"})
+        second = self.exporter._format_labels({"application": "app", "queue": "Q1"})
+
+        self.assertEqual(first, '{application="app",queue="Q1"}')
+        self.assertEqual(second, first)
+
+    def test_label_formatting_distinguishes_equal_values(self):
+        """Test label values that compare equal but print differently are not conflated"""
+        self.assertEqual(self.exporter._format_labels({"x": 1}), '{x="1"}')
+        self.assertEqual(self.exporter._format_labels({"x": True}), '{x="True"}')
+        self.assertEqual(self.exporter._format_labels({"x": 1.0}), '{x="1.0"}')
+
     def test_reader_writer_metrics(self):
         """Test reader/writer detection metrics"""
         # Sample MQ data with accounting messages
@@ -132,6 +146,17 @@ class TestPrometheusExporter(unittest.TestCase):
         # Should generate basic metrics
         self.assertIn("ibmmq_queue_depth_current", self.exporter.metrics)
         self.assertIn("ibmmq_last_collection_timestamp", self.exporter.metrics)
+    
+    def test_collection_timestamp_from_epoch(self):
+        """Test collection timestamp prefers the epoch value over the ISO string"""
+        self.exporter._add_collection_metadata({
+            "queue_manager": "TEST_QM",
+            "timestamp": "2025-11-08T10:30:00+00:00",
+            "timestamp_epoch": 1762597800.5
+        })
+        
+        entries = self.exporter.metrics["ibmmq_last_collection_timestamp"]
+        self.assertEqual(entries[0]['value'], 1762597800)
 
 class TestEnhancedPCFExtractor(unittest.TestCase):
     """Test cases for enhanced PCF data extraction"""
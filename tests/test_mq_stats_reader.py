@@ -307,6 +307,71 @@ class TestMQStatsReader:
             result = reader._identify_statistics_type(unknown_msg)
             assert result == 'unknown_statistics'
 
+    def test_identify_statistics_type_from_header(self):
+        """Test statistics type identification from the PCF header command"""
+        with patch.dict(sys.modules, {
+            'config': MagicMock(**self.mock_config),
+            'pcf_parser': MagicMock()
+        }):
+            import struct
+            from mq_constants import MQCMD_STATISTICS_Q, MQCMD_STATISTICS_CHANNEL
+            reader = MQStatsReader()
+            
+            # Big-endian header
+            queue_msg = struct.pack('>4L', 21, 36, 1, MQCMD_STATISTICS_Q)
+            assert reader._identify_statistics_type(queue_msg) == 'queue_statistics'
+            
+            # Native little-endian header
+            channel_msg = struct.pack('<4L', 21, 36, 1, MQCMD_STATISTICS_CHANNEL)
+            assert reader._identify_statistics_type(channel_msg) == 'channel_statistics'
+
+    @pytest.mark.parametrize('parallel_drain', [False, True])
+    def test_drain_queues(self, parallel_drain):
+        """Test draining both queues sequentially and on the thread pool"""
+        import mq_stats_reader
+        reader = MQStatsReader()
+        stats_data = [{'message_type': 'statistics'}]
+        accounting_data = [{'message_type': 'accounting'}]
+
+        with patch.dict(mq_stats_reader.STATS_CONFIG, {'parallel_drain': parallel_drain}), \
+                patch.object(reader, 'read_statistics_queue', return_value=stats_data) as read_stats, \
+                patch.object(reader, 'read_accounting_queue', return_value=accounting_data) as read_acct:
+            result = reader.drain_queues()
+
+        assert result == (stats_data, accounting_data)
+        read_stats.assert_called_once_with()
+        read_acct.assert_called_once_with()
+
+    def test_drain_queues_defaults_to_sequential(self):
+        """Test the thread pool is only used when parallel_drain is enabled"""
+        import mq_stats_reader
+        reader = MQStatsReader()
+
+        with patch.object(mq_stats_reader, 'ThreadPoolExecutor') as executor, \
+                patch.object(reader, 'read_statistics_queue', return_value=[]), \
+                patch.object(reader, 'read_accounting_queue', return_value=[]):
+            reader.drain_queues()
+
+        assert mq_stats_reader.STATS_CONFIG.get('parallel_drain', False) is False
+        executor.assert_not_called()
+
+    @pytest.mark.parametrize('parallel_drain', [False, True])
+    def test_connect_shares_handle_only_for_parallel_drain(self, parallel_drain):
+        """Test MQCNO_HANDLE_SHARE_BLOCK is only requested for the parallel drain"""
+        import mq_stats_reader
+        mock_pymqi = MagicMock()
+        reader = MQStatsReader()
+
+        with patch.object(mq_stats_reader, 'pymqi', mock_pymqi), \
+                patch.dict(mq_stats_reader.STATS_CONFIG, {'parallel_drain': parallel_drain}):
+            assert reader.connect_to_mq() is True
+
+        call = mock_pymqi.QueueManager.return_value.connect_with_options.call_args
+        if parallel_drain:
+            assert call.kwargs['opts'] == mock_pymqi.CMQC.MQCNO_HANDLE_SHARE_BLOCK
+        else:
+            assert 'opts' not in call.kwargs
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -35,6 +35,17 @@ class TestPCFParser:
         result = self.parser.parse_message(short_message)
         assert result is None
 
+    def test_parse_dict_message(self):
+        """Test parsing a message that is already in dictionary format"""
+        result = self.parser.parse_message({
+            'message_type': 'accounting',
+            'parameters': {2016: 'TEST.QUEUE', 'not_an_id': 1}
+        })
+        assert result['message_type'] == 'accounting'
+        assert result['message_size'] == 0
+        assert len(result['parameters']) == 1
+        assert result['parameters'][0]['value'] == 'TEST.QUEUE'
+
     def test_parse_valid_pcf_header(self):
         """Test parsing valid PCF header"""
         # Create minimal PCF header (36 bytes)
@@ -143,6 +154,39 @@ class TestPCFParser:
         assert result['has_readers'] is True
         assert result['has_writers'] is True
 
+    def test_extract_queue_operations_by_parameter_id(self):
+        """Test extracting queue operations keyed on parameter IDs"""
+        from mq_constants import PARAMETER_NAMES
+        ids = {name: param_id for param_id, name in PARAMETER_NAMES.items()}
+        parsed_message = {
+            'parameters': [
+                {'parameter_id': ids['MQCA_Q_NAME'], 'value': 'TEST.QUEUE  '},
+                {'parameter_id': ids['MQIA_MSG_DEQ_COUNT'], 'value': 7},
+                {'parameter_id': ids['MQIA_MSG_ENQ_COUNT'], 'value': 'not_an_int'}
+            ]
+        }
+
+        result = self.parser.extract_queue_operations(parsed_message)
+
+        assert result['queue_name'] == 'TEST.QUEUE'
+        assert result['get_count'] == 7
+        assert result['put_count'] == 0
+
+    def test_extract_queue_operations_checks_parameter_type(self):
+        """Test that parsed parameters are matched on their PCF type"""
+        from mq_constants import MQCA_Q_NAME, MQCFT_BYTE_STRING, MQCFT_STRING
+        parsed_message = {
+            'parameters': [
+                {'parameter_id': MQCA_Q_NAME, 'parameter_type': MQCFT_BYTE_STRING, 'value': '0a0b'},
+            ]
+        }
+
+        assert self.parser.extract_queue_operations(parsed_message)['queue_name'] == 'unknown'
+
+        parsed_message['parameters'].append(
+            {'parameter_id': MQCA_Q_NAME, 'parameter_type': MQCFT_STRING, 'value': 'TEST.QUEUE'})
+        assert self.parser.extract_queue_operations(parsed_message)['queue_name'] == 'TEST.QUEUE'
+
     def test_extract_connection_info_empty(self):
         """Test extracting connection info from empty message"""
         result = self.parser.extract_connection_info({})
@@ -170,6 +214,24 @@ class TestPCFParser:
         assert result['connect_count'] == 5
         assert result['disconnect_count'] == 2
 
+    def test_extract_accounting_info(self):
+        """Test extracting queue operations and connection info together"""
+        parsed_message = {
+            'parameters': [
+                {'parameter_name': 'MQCA_Q_NAME', 'value': 'TEST.QUEUE'},
+                {'parameter_name': 'MQCA_APPL_NAME', 'value': 'App.jar '},
+                {'parameter_name': 'MQIAMO_PUTS', 'value': 3}
+            ]
+        }
+
+        operations, connection_info = self.parser.extract_accounting_info(parsed_message)
+
+        assert operations == self.parser.extract_queue_operations(parsed_message)
+        assert connection_info == self.parser.extract_connection_info(parsed_message)
+        assert operations['put_count'] == 3
+        assert operations['has_writers'] is True
+        assert connection_info['application_name'] == 'App.jar'
+
     def test_parse_integer_parameter(self):
         """Test parsing integer parameter"""
         # Create integer parameter: header + value
@@ -200,6 +262,27 @@ class TestPCFParser:
         assert result['value'] == 'TEST.QUEUE'
         assert result['total_length'] == 12 + aligned_length
 
+    def test_only_allowlisted_strings_are_interned(self):
+        """Test that names are interned but per-connection strings are not"""
+        import sys
+
+        def string_parameter(param_id, text):
+            data = text.encode('ascii')
+            padded = data + b' ' * (-len(data) % 4)
+            return (param_id.to_bytes(4, 'big') + (4).to_bytes(4, 'big') +
+                    len(data).to_bytes(4, 'big') + padded)
+
+        # Interned references built at runtime so they are not code constants
+        queue_name = sys.intern(''.join(['TEST', '.QUEUE']))
+        connection_name = sys.intern(''.join(['10.0.0.1', '(1414)']))
+
+        queue_param = self.parser._parse_single_parameter(string_parameter(2016, 'TEST.QUEUE'))
+        connection_param = self.parser._parse_single_parameter(string_parameter(3502, '10.0.0.1(1414)'))
+
+        assert queue_param['value'] is queue_name
+        assert connection_param['value'] == connection_name
+        assert connection_param['value'] is not connection_name
+
     def test_parse_malformed_message(self):
         """Test parsing malformed PCF message"""
         # Create malformed header that's too short (less than 36 bytes)